@@ -21,9 +21,8 @@ import (
 	//"google.golang.org/grpc/status"
 	//"fmt"
 	"io/ioutil"
-	"os"
-	"os/exec"
 	"reflect"
+	"strconv"
 	"strings"
 	"testing"
 	"time"
@@ -109,18 +108,40 @@ func getRedisClient(t *testing.T) *redis.Client {
 	return rclient
 }
 
+// redis-cli style clients, one per db number, reused across exe_cmd calls
+var redisCliClients = make(map[int]*redis.Client)
+
+// exe_cmd runs a "redis-cli -n <db> <command> <args>..." line through a
+// go-redis client instead of forking redis-cli for every command.
 func exe_cmd(t *testing.T, cmd string) {
-	//fmt.Println("command is ", cmd)
 	parts := strings.Fields(cmd)
-	head := parts[0]
-	parts = parts[1:len(parts)]
-
-	_, err := exec.Command(head, parts...).Output()
+	if len(parts) < 4 || parts[0] != "redis-cli" || parts[1] != "-n" {
+		t.Fatalf("%s: only \"redis-cli -n <db> ...\" commands are supported", cmd)
+	}
+	n, err := strconv.Atoi(parts[2])
 	if err != nil {
 		t.Fatalf("%s %s", cmd, err)
 	}
-	// fmt.Printf("%s", out)
-	// wg.Done() // Need to signal to waitgroup that this goroutine is done
+
+	rclient, ok := redisCliClients[n]
+	if !ok {
+		rclient = redis.NewClient(&redis.Options{
+			Network:     "tcp",
+			Addr:        sdcfg.GetDbTcpAddr("CONFIG_DB", sdcfg.GetDbDefaultNamespace()),
+			Password:    "", // no password set
+			DB:          n,
+			DialTimeout: 0,
+		})
+		redisCliClients[n] = rclient
+	}
+
+	args := make([]interface{}, 0, len(parts)-3)
+	for _, arg := range parts[3:] {
+		args = append(args, arg)
+	}
+	if err := rclient.Do(args...).Err(); err != nil {
+		t.Fatalf("%s %s", cmd, err)
+	}
 }
 
 func getConfigDbClient(t *testing.T) *redis.Client {
@@ -179,9 +200,7 @@ func prepareDb(t *testing.T) {
 	defer rclient.Close()
 	rclient.FlushDB()
 	//Enable keysapce notification
-	os.Setenv("PATH", "$PATH:/usr/bin:/sbin:/bin:/usr/local/bin:/usr/local/Cellar/redis/4.0.8/bin")
-	cmd := exec.Command("redis-cli", "config", "set", "notify-keyspace-events", "KEA")
-	_, err := cmd.Output()
+	err := rclient.ConfigSet("notify-keyspace-events", "KEA").Err()
 	if err != nil {
 		t.Fatal("failed to enable redis keyspace notification ", err)
 	}
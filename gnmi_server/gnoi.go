@@ -157,7 +157,7 @@ func (srv *Server) ClearNeighbors(ctx context.Context, req *spb.ClearNeighborsRe
         return nil, status.Error(codes.Unknown, err.Error())
     }
 
-    jsresp, err:= transutil.TranslProcessAction("/sonic-neighbor:clear-neighbors", []byte(reqstr), ctx)
+    jsresp, err:= transutil.TranslProcessAction("/sonic-neighbor:clear-neighbors", reqstr, ctx)
 
     if err != nil {
         return nil, status.Error(codes.Unknown, err.Error())
@@ -188,7 +188,7 @@ func (srv *Server) CopyConfig(ctx context.Context, req *spb.CopyConfigRequest) (
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
-	jsresp, err:= transutil.TranslProcessAction("/sonic-config-mgmt:copy", []byte(reqstr), ctx)
+	jsresp, err:= transutil.TranslProcessAction("/sonic-config-mgmt:copy", reqstr, ctx)
 
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
@@ -219,7 +219,7 @@ func (srv *Server) ShowTechsupport(ctx context.Context, req *spb.TechsupportRequ
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
-	jsresp, err:= transutil.TranslProcessAction("/sonic-show-techsupport:sonic-show-techsupport-info", []byte(reqstr), ctx)
+	jsresp, err:= transutil.TranslProcessAction("/sonic-show-techsupport:sonic-show-techsupport-info", reqstr, ctx)
 
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
@@ -251,7 +251,7 @@ func (srv *Server) ImageInstall(ctx context.Context, req *spb.ImageInstallReques
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
-	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-install", []byte(reqstr), ctx)
+	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-install", reqstr, ctx)
 
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
@@ -284,7 +284,7 @@ func (srv *Server) ImageRemove(ctx context.Context, req *spb.ImageRemoveRequest)
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
-	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-remove", []byte(reqstr), ctx)
+	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-remove", reqstr, ctx)
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
@@ -316,7 +316,7 @@ func (srv *Server) ImageDefault(ctx context.Context, req *spb.ImageDefaultReques
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
-	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-default", []byte(reqstr), ctx)
+	jsresp, err:= transutil.TranslProcessAction("/sonic-image-management:image-default", reqstr, ctx)
 	if err != nil {
 		return nil, status.Error(codes.Unknown, err.Error())
 	}
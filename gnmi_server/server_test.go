@@ -14,8 +14,6 @@ import (
 	"github.com/golang/protobuf/proto"
 
 	"io/ioutil"
-	"os"
-	"os/exec"
 	"reflect"
 	"testing"
 	"time"
@@ -62,18 +60,24 @@ func loadConfig(t *testing.T, key string, in []byte) map[string]interface{} {
 }
 
 // assuming input data is in key field/value pair format
+// All keys are written in one pipelined round trip.
 func loadDB(t *testing.T, rclient *redis.Client, mpi map[string]interface{}) {
+	pipe := rclient.Pipeline()
+	defer pipe.Close()
 	for key, fv := range mpi {
 		switch fv.(type) {
 		case map[string]interface{}:
-			_, err := rclient.HMSet(key, fv.(map[string]interface{})).Result()
-			if err != nil {
-				t.Errorf("Invalid data for db:  %v : %v %v", key, fv, err)
-			}
+			pipe.HMSet(key, fv.(map[string]interface{}))
 		default:
 			t.Errorf("Invalid data for db: %v : %v", key, fv)
 		}
 	}
+	cmds, _ := pipe.Exec()
+	for _, cmd := range cmds {
+		if err := cmd.Err(); err != nil {
+			t.Errorf("Invalid data for db:  %v %v", cmd.Args(), err)
+		}
+	}
 }
 func loadDBNotStrict(t *testing.T, rclient *redis.Client, mpi map[string]interface{}) {
 	for key, fv := range mpi {
@@ -278,17 +282,24 @@ func getConfigDbClient(t *testing.T, namespace string) *redis.Client {
 }
 
 func loadConfigDB(t *testing.T, rclient *redis.Client, mpi map[string]interface{}) {
-	for key, fv := range mpi {
-		switch fv.(type) {
-		case map[string]interface{}:
-			_, err := rclient.HMSet(key, fv.(map[string]interface{})).Result()
-			if err != nil {
-				t.Errorf("Invalid data for db: %v : %v %v", key, fv, err)
-			}
-		default:
-			t.Errorf("Invalid data for db: %v : %v", key, fv)
-		}
+	loadDB(t, rclient, mpi)
+}
+
+var testDataCache = make(map[string][]byte)
+
+// readTestData returns the content of a testdata file. Each file is read from
+// disk only once, since prepareDb reloads the same fixtures before every
+// subscribe test case.
+func readTestData(t *testing.T, fileName string) []byte {
+	if data, ok := testDataCache[fileName]; ok {
+		return data
 	}
+	data, err := ioutil.ReadFile(fileName)
+	if err != nil {
+		t.Fatalf("read file %v err: %v", fileName, err)
+	}
+	testDataCache[fileName] = data
+	return data
 }
 
 func prepareConfigDb(t *testing.T, namespace string) {
@@ -296,19 +307,11 @@ func prepareConfigDb(t *testing.T, namespace string) {
 	defer rclient.Close()
 	rclient.FlushDB()
 
-	fileName := "../testdata/COUNTERS_PORT_ALIAS_MAP.txt"
-	countersPortAliasMapByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersPortAliasMapByte := readTestData(t, "../testdata/COUNTERS_PORT_ALIAS_MAP.txt")
 	mpi_alias_map := loadConfig(t, "", countersPortAliasMapByte)
 	loadConfigDB(t, rclient, mpi_alias_map)
 
-	fileName = "../testdata/CONFIG_PFCWD_PORTS.txt"
-	configPfcwdByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	configPfcwdByte := readTestData(t, "../testdata/CONFIG_PFCWD_PORTS.txt")
 	mpi_pfcwd_map := loadConfig(t, "", configPfcwdByte)
 	loadConfigDB(t, rclient, mpi_pfcwd_map)
 }
@@ -319,85 +322,55 @@ func prepareStateDb(t *testing.T, namespace string) {
 	rclient.HSet("SWITCH_CAPABILITY|switch", "test_field", "test_value")
 }
 
+// enableKeyspaceNotification turns on redis keyspace events through the
+// existing client connection rather than forking redis-cli.
+func enableKeyspaceNotification(t *testing.T, rclient *redis.Client) {
+	if err := rclient.ConfigSet("notify-keyspace-events", "KEA").Err(); err != nil {
+		t.Fatal("failed to enable redis keyspace notification ", err)
+	}
+}
+
 func prepareDb(t *testing.T, namespace string) {
 	rclient := getRedisClient(t, namespace)
 	defer rclient.Close()
 	rclient.FlushDB()
-	//Enable keysapce notification
-	os.Setenv("PATH", "/usr/bin:/sbin:/bin:/usr/local/bin")
-	cmd := exec.Command("redis-cli", "config", "set", "notify-keyspace-events", "KEA")
-	_, err := cmd.Output()
-	if err != nil {
-		t.Fatal("failed to enable redis keyspace notification ", err)
-	}
+	enableKeyspaceNotification(t, rclient)
 
-	fileName := "../testdata/COUNTERS_PORT_NAME_MAP.txt"
-	countersPortNameMapByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersPortNameMapByte := readTestData(t, "../testdata/COUNTERS_PORT_NAME_MAP.txt")
 	mpi_name_map := loadConfig(t, "COUNTERS_PORT_NAME_MAP", countersPortNameMapByte)
 	loadDB(t, rclient, mpi_name_map)
 
-	fileName = "../testdata/COUNTERS_QUEUE_NAME_MAP.txt"
-	countersQueueNameMapByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersQueueNameMapByte := readTestData(t, "../testdata/COUNTERS_QUEUE_NAME_MAP.txt")
 	mpi_qname_map := loadConfig(t, "COUNTERS_QUEUE_NAME_MAP", countersQueueNameMapByte)
 	loadDB(t, rclient, mpi_qname_map)
 
-	fileName = "../testdata/COUNTERS:Ethernet68.txt"
-	countersEthernet68Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68Byte := readTestData(t, "../testdata/COUNTERS:Ethernet68.txt")
 	// "Ethernet68": "oid:0x1000000000039",
 	mpi_counter := loadConfig(t, "COUNTERS:oid:0x1000000000039", countersEthernet68Byte)
 	loadDB(t, rclient, mpi_counter)
 
-	fileName = "../testdata/COUNTERS:Ethernet1.txt"
-	countersEthernet1Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet1Byte := readTestData(t, "../testdata/COUNTERS:Ethernet1.txt")
 	// "Ethernet1": "oid:0x1000000000003",
 	mpi_counter = loadConfig(t, "COUNTERS:oid:0x1000000000003", countersEthernet1Byte)
 	loadDB(t, rclient, mpi_counter)
 
 	// "Ethernet64:0": "oid:0x1500000000092a"  : queue counter, to work as data noise
-	fileName = "../testdata/COUNTERS:oid:0x1500000000092a.txt"
-	counters92aByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	counters92aByte := readTestData(t, "../testdata/COUNTERS:oid:0x1500000000092a.txt")
 	mpi_counter = loadConfig(t, "COUNTERS:oid:0x1500000000092a", counters92aByte)
 	loadDB(t, rclient, mpi_counter)
 
 	// "Ethernet68:1": "oid:0x1500000000091c"  : queue counter, for COUNTERS/Ethernet68/Queue vpath test
-	fileName = "../testdata/COUNTERS:oid:0x1500000000091c.txt"
-	countersEeth68_1Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEeth68_1Byte := readTestData(t, "../testdata/COUNTERS:oid:0x1500000000091c.txt")
 	mpi_counter = loadConfig(t, "COUNTERS:oid:0x1500000000091c", countersEeth68_1Byte)
 	loadDB(t, rclient, mpi_counter)
 
 	// "Ethernet68:3": "oid:0x1500000000091e"  : lossless queue counter, for COUNTERS/Ethernet68/Pfcwd vpath test
-	fileName = "../testdata/COUNTERS:oid:0x1500000000091e.txt"
-	countersEeth68_3Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEeth68_3Byte := readTestData(t, "../testdata/COUNTERS:oid:0x1500000000091e.txt")
 	mpi_counter = loadConfig(t, "COUNTERS:oid:0x1500000000091e", countersEeth68_3Byte)
 	loadDB(t, rclient, mpi_counter)
 
 	// "Ethernet68:4": "oid:0x1500000000091f"  : lossless queue counter, for COUNTERS/Ethernet68/Pfcwd vpath test
-	fileName = "../testdata/COUNTERS:oid:0x1500000000091f.txt"
-	countersEeth68_4Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEeth68_4Byte := readTestData(t, "../testdata/COUNTERS:oid:0x1500000000091f.txt")
 	mpi_counter = loadConfig(t, "COUNTERS:oid:0x1500000000091f", countersEeth68_4Byte)
 	loadDB(t, rclient, mpi_counter)
 
@@ -411,23 +384,12 @@ func prepareDb(t *testing.T, namespace string) {
 func prepareDbTranslib(t *testing.T) {
 	rclient := getRedisClient(t, sdcfg.GetDbDefaultNamespace())
 	rclient.FlushDB()
+	enableKeyspaceNotification(t, rclient)
 	rclient.Close()
 
-	//Enable keysapce notification
-	os.Setenv("PATH", "/usr/bin:/sbin:/bin:/usr/local/bin")
-	cmd := exec.Command("redis-cli", "config", "set", "notify-keyspace-events", "KEA")
-	_, err := cmd.Output()
-	if err != nil {
-		t.Fatal("failed to enable redis keyspace notification ", err)
-	}
-
-	fileName := "../testdata/db_dump.json"
-	countersPortNameMapByte, err := ioutil.ReadFile(fileName)
+	dbDumpByte := readTestData(t, "../testdata/db_dump.json")
 	var rj []map[string]interface{}
-	json.Unmarshal(countersPortNameMapByte, &rj)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	json.Unmarshal(dbDumpByte, &rj)
 	for n, v := range rj {
 		rclient := getRedisClientN(t, n, sdcfg.GetDbDefaultNamespace())
 		loadDBNotStrict(t, rclient, v)
@@ -712,47 +674,19 @@ func runGnmiTestGet(t *testing.T, namespace string) {
 	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
 	defer cancel()
 
-	fileName := "../testdata/COUNTERS_PORT_NAME_MAP.txt"
-	countersPortNameMapByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersPortNameMapByte := readTestData(t, "../testdata/COUNTERS_PORT_NAME_MAP.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet68.txt"
-	countersEthernet68Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68Byte := readTestData(t, "../testdata/COUNTERS:Ethernet68.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet68:Pfcwd.txt"
-	countersEthernet68PfcwdByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68PfcwdByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Pfcwd.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet68:Pfcwd_alias.txt"
-	countersEthernet68PfcwdAliasByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68PfcwdAliasByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Pfcwd_alias.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_alias.txt"
-	countersEthernetWildcardByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildcardByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_alias.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_PFC_7_RX_alias.txt"
-	countersEthernetWildcardPfcByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildcardPfcByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_PFC_7_RX_alias.txt")
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_Pfcwd_alias.txt"
-	countersEthernetWildcardPfcwdByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildcardPfcwdByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_Pfcwd_alias.txt")
 
 	stateDBPath := "STATE_DB"
 
@@ -1180,11 +1114,7 @@ type tablePathValue struct {
 // runTestSubscribe subscribe DB path in stream mode or poll mode.
 // The return code and response value are compared with expected code and value.
 func runTestSubscribe(t *testing.T, namespace string) {
-	fileName := "../testdata/COUNTERS_PORT_NAME_MAP.txt"
-	countersPortNameMapByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersPortNameMapByte := readTestData(t, "../testdata/COUNTERS_PORT_NAME_MAP.txt")
 	var countersPortNameMapJson interface{}
 	json.Unmarshal(countersPortNameMapByte, &countersPortNameMapJson)
 	var tmp interface{}
@@ -1193,11 +1123,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	countersPortNameMapJsonUpdate["test_field"] = "test_value"
 
 	// for table key subscription
-	fileName = "../testdata/COUNTERS:Ethernet68.txt"
-	countersEthernet68Byte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68Byte := readTestData(t, "../testdata/COUNTERS:Ethernet68.txt")
 	var countersEthernet68Json interface{}
 	json.Unmarshal(countersEthernet68Byte, &countersEthernet68Json)
 
@@ -1213,11 +1139,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	countersEthernet68JsonPfcUpdate["SAI_PORT_STAT_PFC_7_RX_PKTS"] = "4"
 
 	// for Ethernet68/Pfcwd subscription
-	fileName = "../testdata/COUNTERS:Ethernet68:Pfcwd.txt"
-	countersEthernet68PfcwdByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68PfcwdByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Pfcwd.txt")
 	var countersEthernet68PfcwdJson interface{}
 	json.Unmarshal(countersEthernet68PfcwdByte, &countersEthernet68PfcwdJson)
 
@@ -1231,11 +1153,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	countersEthernet68PfcwdPollUpdate := tmp4
 
 	// (use vendor alias) for Ethernet68/1 Pfcwd subscription
-	fileName = "../testdata/COUNTERS:Ethernet68:Pfcwd_alias.txt"
-	countersEthernet68PfcwdAliasByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68PfcwdAliasByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Pfcwd_alias.txt")
 	var countersEthernet68PfcwdAliasJson interface{}
 	json.Unmarshal(countersEthernet68PfcwdAliasByte, &countersEthernet68PfcwdAliasJson)
 
@@ -1248,11 +1166,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	tmp5.(map[string]interface{})["Ethernet68/1:3"].(map[string]interface{})["PFC_WD_QUEUE_STATS_DEADLOCK_DETECTED"] = "1"
 	countersEthernet68PfcwdAliasPollUpdate := tmp5
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_alias.txt"
-	countersEthernetWildcardByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildcardByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_alias.txt")
 	var countersEthernetWildcardJson interface{}
 	json.Unmarshal(countersEthernetWildcardByte, &countersEthernetWildcardJson)
 	// Will have "test_field" : "test_value" in Ethernet68,
@@ -1263,11 +1177,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	json.Unmarshal(countersEthernetWildcardByte, &countersFieldUpdate)
 	countersFieldUpdate["Ethernet68/1"] = countersEthernet68JsonPfcUpdate
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_PFC_7_RX_alias.txt"
-	countersEthernetWildcardPfcByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildcardPfcByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_PFC_7_RX_alias.txt")
 	var countersEthernetWildcardPfcJson interface{}
 	json.Unmarshal(countersEthernetWildcardPfcByte, &countersEthernetWildcardPfcJson)
 	//The update with new value of 4 (original value is 2)
@@ -1281,11 +1191,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	allPortPfcJsonUpdate["Ethernet68/1"] = pfc7Map
 
 	// for Ethernet*/Pfcwd subscription
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_Pfcwd_alias.txt"
-	countersEthernetWildPfcwdByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildPfcwdByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_Pfcwd_alias.txt")
 
 	var countersEthernetWildPfcwdJson interface{}
 	json.Unmarshal(countersEthernetWildPfcwdByte, &countersEthernetWildPfcwdJson)
@@ -1295,19 +1201,11 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	tmp6.(map[string]interface{})["Ethernet68/1:3"].(map[string]interface{})["PFC_WD_QUEUE_STATS_DEADLOCK_DETECTED"] = "1"
 	countersEthernetWildPfcwdUpdate := tmp6
 
-	fileName = "../testdata/COUNTERS:Ethernet_wildcard_Queues_alias.txt"
-	countersEthernetWildQueuesByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernetWildQueuesByte := readTestData(t, "../testdata/COUNTERS:Ethernet_wildcard_Queues_alias.txt")
 	var countersEthernetWildQueuesJson interface{}
 	json.Unmarshal(countersEthernetWildQueuesByte, &countersEthernetWildQueuesJson)
 
-	fileName = "../testdata/COUNTERS:Ethernet68:Queues.txt"
-	countersEthernet68QueuesByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68QueuesByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Queues.txt")
 	var countersEthernet68QueuesJson interface{}
 	json.Unmarshal(countersEthernet68QueuesByte, &countersEthernet68QueuesJson)
 
@@ -1322,11 +1220,7 @@ func runTestSubscribe(t *testing.T, namespace string) {
 	countersEthernet68QueuesJsonUpdate["Ethernet68:1"] = eth68_1
 
 	// Alias translation for query Ethernet68/1:Queues
-	fileName = "../testdata/COUNTERS:Ethernet68:Queues_alias.txt"
-	countersEthernet68QueuesAliasByte, err := ioutil.ReadFile(fileName)
-	if err != nil {
-		t.Fatalf("read file %v err: %v", fileName, err)
-	}
+	countersEthernet68QueuesAliasByte := readTestData(t, "../testdata/COUNTERS:Ethernet68:Queues_alias.txt")
 	var countersEthernet68QueuesAliasJson interface{}
 	json.Unmarshal(countersEthernet68QueuesAliasByte, &countersEthernet68QueuesAliasJson)
 
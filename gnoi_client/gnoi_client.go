@@ -29,6 +29,13 @@ func setUserCreds(ctx context.Context) context.Context {
 	}
 	return ctx
 }
+func printResp(resp interface{}) {
+	respstr, err := json.Marshal(resp)
+	if err != nil {
+		panic(err.Error())
+	}
+	fmt.Println(string(respstr))
+}
 func main() {
 	flag.Parse()
 	opts := credentials.ClientCredentials(*targetName)
@@ -96,11 +103,7 @@ func systemTime(sc gnoi_system_pb.SystemClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func sonicShowTechSupport(sc spb.SonicServiceClient, ctx context.Context) {
@@ -118,11 +121,7 @@ func sonicShowTechSupport(sc spb.SonicServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func copyConfig(sc spb.SonicServiceClient, ctx context.Context) {
@@ -138,11 +137,7 @@ func copyConfig(sc spb.SonicServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 func imageInstall(sc spb.SonicServiceClient, ctx context.Context) {
 	fmt.Println("Sonic ImageInstall")
@@ -157,11 +152,7 @@ func imageInstall(sc spb.SonicServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 func imageRemove(sc spb.SonicServiceClient, ctx context.Context) {
 	fmt.Println("Sonic ImageRemove")
@@ -176,11 +167,7 @@ func imageRemove(sc spb.SonicServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func imageDefault(sc spb.SonicServiceClient, ctx context.Context) {
@@ -196,11 +183,7 @@ func imageDefault(sc spb.SonicServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func authenticate(sc spb_jwt.SonicJwtServiceClient, ctx context.Context) {
@@ -214,11 +197,7 @@ func authenticate(sc spb_jwt.SonicJwtServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func refresh(sc spb_jwt.SonicJwtServiceClient, ctx context.Context) {
@@ -232,11 +211,7 @@ func refresh(sc spb_jwt.SonicJwtServiceClient, ctx context.Context) {
 	if err != nil {
 		panic(err.Error())
 	}
-	respstr, err := json.Marshal(resp)
-	if err != nil {
-		panic(err.Error())
-	}
-	fmt.Println(string(respstr))
+	printResp(resp)
 }
 
 func clearNeighbors(sc spb.SonicServiceClient, ctx context.Context) {
@@ -252,9 +227,5 @@ func clearNeighbors(sc spb.SonicServiceClient, ctx context.Context) {
     if err != nil {
         panic(err.Error())
     }
-    respstr, err := json.Marshal(resp)
-    if err != nil {
-        panic(err.Error())
-    }
-    fmt.Println(string(respstr))
+    printResp(resp)
 }
@@ -1,39 +1,25 @@
 package test_utils
 
 import (
-	"io"
+	"io/ioutil"
 	"os"
+	"path/filepath"
 )
 
 func SetupMultiNamespace() error {
-	err := os.MkdirAll("/var/run/redis0/sonic-db/", 0755)
-	if err != nil {
-		return err
-	}
 	srcFileName := [2]string{"../testdata/database_global.json", "../testdata/database_config_asic0.json"}
 	dstFileName := [2]string{"/var/run/redis/sonic-db/database_global.json", "/var/run/redis0/sonic-db/database_config_asic0.json"}
 	for i := 0; i < len(srcFileName); i++ {
-		sourceFileStat, err := os.Stat(srcFileName[i])
-		if err != nil {
-			return err
-		}
-
-		if !sourceFileStat.Mode().IsRegular() {
-			return err
-		}
-
-		source, err := os.Open(srcFileName[i])
+		err := os.MkdirAll(filepath.Dir(dstFileName[i]), 0755)
 		if err != nil {
 			return err
 		}
-		defer source.Close()
 
-		destination, err := os.Create(dstFileName[i])
+		data, err := ioutil.ReadFile(srcFileName[i])
 		if err != nil {
 			return err
 		}
-		defer destination.Close()
-		_, err = io.Copy(destination, source)
+		err = ioutil.WriteFile(dstFileName[i], data, 0644)
 		if err != nil {
 			return err
 		}
@@ -78,34 +78,39 @@ func ConvertToURI(prefix *gnmipb.Path, path *gnmipb.Path, req *string) error {
 	}
 
 	elems := fullPath.GetElem()
-	*req = "/"
+	var b strings.Builder
+	b.WriteString("/")
 
 	if elems != nil {
 		/* Iterate through elements. */
 		for i, elem := range elems {
 			log.V(6).Infof("index %d elem : %#v %#v", i, elem.GetName(), elem.GetKey())
-			*req += elem.GetName()
+			b.WriteString(elem.GetName())
 			key := elem.GetKey()
 			/* If no keys are present end the element with "/" */
 			if key == nil {
-				*req += "/"
+				b.WriteString("/")
 			}
 
 			/* If keys are present , process the keys. */
 			if key != nil {
 				for k, v := range key {
 					log.V(6).Infof("elem : %#v %#v", k, v)
-					*req += "[" + k + "=" + v + "]"
+					b.WriteString("[")
+					b.WriteString(k)
+					b.WriteString("=")
+					b.WriteString(v)
+					b.WriteString("]")
 				}
 
 				/* Append "/" after all keys are processed. */
-				*req += "/"
+				b.WriteString("/")
 			}
 		}
 	}
 
 	/* Trim the "/" at the end which is not required. */
-	*req = strings.TrimSuffix(*req, "/")
+	*req = strings.TrimSuffix(b.String(), "/")
 	return nil
 }
 
@@ -178,11 +183,10 @@ func TranslProcessDelete(uri string, ctx context.Context) error {
 /* Replace request handling. */
 func TranslProcessReplace(uri string, t *gnmipb.TypedValue, ctx context.Context) error {
 	/* Form the CURL request and send to client . */
-	str := string(t.GetJsonIetfVal())
-	str3 := strings.Replace(str, "\n", "", -1)
-	log.V(2).Info("Incoming JSON body is", str)
+	body := t.GetJsonIetfVal()
+	log.V(2).Infof("Incoming JSON body is %s", body)
 
-	payload := []byte(str3)
+	payload := bytes.Replace(body, []byte("\n"), nil, -1)
 	rc, _ := common_utils.GetContext(ctx)
 	req := translib.SetRequest{Path:uri, Payload:payload, User: translib.UserRoles{Name: rc.Auth.User, Roles: rc.Auth.Roles}}
 	if rc.BundleVersion != nil {
@@ -210,11 +214,10 @@ func TranslProcessReplace(uri string, t *gnmipb.TypedValue, ctx context.Context)
 /* Update request handling. */
 func TranslProcessUpdate(uri string, t *gnmipb.TypedValue, ctx context.Context) error {
 	/* Form the CURL request and send to client . */
-	str := string(t.GetJsonIetfVal())
-	str3 := strings.Replace(str, "\n", "", -1)
-	log.V(2).Info("Incoming JSON body is", str)
+	body := t.GetJsonIetfVal()
+	log.V(2).Infof("Incoming JSON body is %s", body)
 
-	payload := []byte(str3)
+	payload := bytes.Replace(body, []byte("\n"), nil, -1)
 	rc, _ := common_utils.GetContext(ctx)
 	req := translib.SetRequest{Path:uri, Payload:payload, User: translib.UserRoles{Name: rc.Auth.User, Roles: rc.Auth.Roles}}
 	if rc.BundleVersion != nil {
@@ -250,9 +253,9 @@ func TranslProcessBulk(delete []*gnmipb.Path, replace []*gnmipb.Update, update [
 	var br translib.BulkRequest
 	var uri string
 
-        var deleteUri []string
-        var replaceUri []string
-        var updateUri []string
+	deleteUri := make([]string, 0, len(delete))
+	var replaceUri []string
+	var updateUri []string
 
 	rc, ctx := common_utils.GetContext(ctx)
 	log.V(2).Info("TranslProcessBulk Called")
@@ -265,10 +268,8 @@ func TranslProcessBulk(delete []*gnmipb.Path, replace []*gnmipb.Update, update [
 			return err
 		}
 	}
-	for _,d := range delete {
-		ConvertToURI(prefix, d, &uri)
-		var str3 string
-		payload := []byte(str3)
+	/* Build a SetRequest carrying the common user and version info. */
+	newSetRequest := func(uri string, payload []byte) translib.SetRequest {
 		req := translib.SetRequest{
 			Path: uri,
 			Payload: payload,
@@ -280,49 +281,31 @@ func TranslProcessBulk(delete []*gnmipb.Path, replace []*gnmipb.Update, update [
 		if rc.Auth.AuthEnabled {
 			req.AuthEnabled = true
 		}
-		br.DeleteRequest = append(br.DeleteRequest, req)
-                deleteUri = append(deleteUri, uri)
+		return req
 	}
-	for _,r := range replace {
-		ConvertToURI(prefix, r.GetPath(), &uri)
-		str := string(r.GetVal().GetJsonIetfVal())
-		str3 := strings.Replace(str, "\n", "", -1)
-		log.V(2).Info("Incoming JSON body is", str)
-		payload := []byte(str3)
-		req := translib.SetRequest{
-			Path: uri,
-			Payload: payload,
-			User: translib.UserRoles{Name: rc.Auth.User, Roles: rc.Auth.Roles},
-		}
-		if rc.BundleVersion != nil {
-			req.ClientVersion = nver
-		}
-		if rc.Auth.AuthEnabled {
-			req.AuthEnabled = true
+
+	/* Replace and update requests are built the same way. */
+	newUpdateRequests := func(updates []*gnmipb.Update) ([]translib.SetRequest, []string) {
+		reqs := make([]translib.SetRequest, 0, len(updates))
+		uris := make([]string, 0, len(updates))
+		for _,u := range updates {
+			ConvertToURI(prefix, u.GetPath(), &uri)
+			body := u.GetVal().GetJsonIetfVal()
+			log.V(2).Infof("Incoming JSON body is %s", body)
+			reqs = append(reqs, newSetRequest(uri, bytes.Replace(body, []byte("\n"), nil, -1)))
+			uris = append(uris, uri)
 		}
-		br.ReplaceRequest = append(br.ReplaceRequest, req)
-                replaceUri = append(replaceUri, uri)
+		return reqs, uris
 	}
-	for _,u := range update {
-		ConvertToURI(prefix, u.GetPath(), &uri)
-		str := string(u.GetVal().GetJsonIetfVal())
-		str3 := strings.Replace(str, "\n", "", -1)
-		log.V(2).Info("Incoming JSON body is", str)
-		payload := []byte(str3)
-		req := translib.SetRequest{
-			Path: uri,
-			Payload: payload,
-			User: translib.UserRoles{Name: rc.Auth.User, Roles: rc.Auth.Roles},
-		}
-		if rc.BundleVersion != nil {
-			req.ClientVersion = nver
-		}
-		if rc.Auth.AuthEnabled {
-			req.AuthEnabled = true
-		}
-		br.UpdateRequest = append(br.UpdateRequest, req)
-                updateUri = append(updateUri, uri)
+
+	br.DeleteRequest = make([]translib.SetRequest, 0, len(delete))
+	for _,d := range delete {
+		ConvertToURI(prefix, d, &uri)
+		br.DeleteRequest = append(br.DeleteRequest, newSetRequest(uri, []byte{}))
+		deleteUri = append(deleteUri, uri)
 	}
+	br.ReplaceRequest, replaceUri = newUpdateRequests(replace)
+	br.UpdateRequest, updateUri = newUpdateRequests(update)
 
 	resp,err := translib.Bulk(br)
 